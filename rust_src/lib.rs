@@ -135,6 +135,73 @@ fn apnumber(value: &Bound<'_, PyAny>) -> PyResult<String> {
     Ok(speakhuman::apnumber(&s))
 }
 
+// ===========================================================================
+// Batched entry points
+//
+// Each PyO3 call pays fixed framework overhead (argument parsing, GIL
+// bookkeeping). These variants take a list and iterate in Rust so that
+// overhead is amortised over the whole batch.
+// ===========================================================================
+
+/// Apply `naturalsize` to every value in a list with shared options.
+#[pyfunction]
+#[pyo3(signature = (values, binary=false, gnu=false, format="%.1f"))]
+fn naturalsize_many(
+    values: &Bound<'_, PyList>,
+    binary: bool,
+    gnu: bool,
+    format: &str,
+) -> PyResult<Vec<String>> {
+    let mut out = Vec::with_capacity(values.len());
+    for value in values.iter() {
+        let bytes: f64 = value.extract().or_else(|_| {
+            let s: String = value.extract()?;
+            s.parse::<f64>()
+                .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+        })?;
+        out.push(speakhuman::naturalsize(bytes, binary, gnu, format));
+    }
+    Ok(out)
+}
+
+/// Apply `intcomma` to every value in a list.
+#[pyfunction]
+#[pyo3(signature = (values, ndigits=None))]
+fn intcomma_many(
+    values: &Bound<'_, PyList>,
+    ndigits: Option<usize>,
+) -> PyResult<Vec<String>> {
+    let mut out = Vec::with_capacity(values.len());
+    for value in values.iter() {
+        let s = value.str()?.to_string();
+        out.push(speakhuman::intcomma(&s, ndigits));
+    }
+    Ok(out)
+}
+
+/// Apply `ordinal` to every value in a list with a shared gender.
+#[pyfunction]
+#[pyo3(signature = (values, gender="male"))]
+fn ordinal_many(values: &Bound<'_, PyList>, gender: &str) -> PyResult<Vec<String>> {
+    let mut out = Vec::with_capacity(values.len());
+    for value in values.iter() {
+        let s = value.str()?.to_string();
+        out.push(speakhuman::number::ordinal_gendered(&s, gender));
+    }
+    Ok(out)
+}
+
+/// Apply `apnumber` to every value in a list.
+#[pyfunction]
+fn apnumber_many(values: &Bound<'_, PyList>) -> PyResult<Vec<String>> {
+    let mut out = Vec::with_capacity(values.len());
+    for value in values.iter() {
+        let s = value.str()?.to_string();
+        out.push(speakhuman::apnumber(&s));
+    }
+    Ok(out)
+}
+
 // ===========================================================================
 // Time
 // ===========================================================================
@@ -215,6 +282,11 @@ fn _speakhuman_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(intcomma, m)?)?;
     m.add_function(wrap_pyfunction!(intword, m)?)?;
     m.add_function(wrap_pyfunction!(apnumber, m)?)?;
+    // Batched
+    m.add_function(wrap_pyfunction!(naturalsize_many, m)?)?;
+    m.add_function(wrap_pyfunction!(intcomma_many, m)?)?;
+    m.add_function(wrap_pyfunction!(ordinal_many, m)?)?;
+    m.add_function(wrap_pyfunction!(apnumber_many, m)?)?;
     // Time
     m.add_function(wrap_pyfunction!(naturaldelta, m)?)?;
     m.add_function(wrap_pyfunction!(naturalday, m)?)?;
@@ -2,30 +2,61 @@
 
 from __future__ import annotations
 
-from speakhuman.filesize import naturalsize
-from speakhuman.i18n import activate, deactivate, decimal_separator, thousands_separator
-from speakhuman.lists import natural_list
-from speakhuman.number import (
-    apnumber,
-    clamp,
-    fractional,
-    intcomma,
-    intword,
-    metric,
-    ordinal,
-    scientific,
-)
-from speakhuman.time import (
-    naturaldate,
-    naturalday,
-    naturaldelta,
-    naturaltime,
-    precisedelta,
-)
-
-from importlib.metadata import version
-
-__version__ = version("speakhuman")
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from speakhuman.filesize import naturalsize
+    from speakhuman.i18n import (
+        activate,
+        deactivate,
+        decimal_separator,
+        thousands_separator,
+    )
+    from speakhuman.lists import natural_list
+    from speakhuman.number import (
+        apnumber,
+        clamp,
+        fractional,
+        intcomma,
+        intcomma_many,
+        intword,
+        metric,
+        ordinal,
+        scientific,
+    )
+    from speakhuman.time import (
+        naturaldate,
+        naturalday,
+        naturaldelta,
+        naturaltime,
+        precisedelta,
+    )
+
+# Submodules are imported lazily (PEP 562) so that importing the package
+# does not pay for submodules the caller never touches.
+_SUBMODULES = frozenset({"filesize", "i18n", "lists", "number", "time"})
+
+_LAZY_SUBMODULE = {
+    "naturalsize": "speakhuman.filesize",
+    "activate": "speakhuman.i18n",
+    "deactivate": "speakhuman.i18n",
+    "decimal_separator": "speakhuman.i18n",
+    "thousands_separator": "speakhuman.i18n",
+    "natural_list": "speakhuman.lists",
+    "apnumber": "speakhuman.number",
+    "clamp": "speakhuman.number",
+    "fractional": "speakhuman.number",
+    "intcomma": "speakhuman.number",
+    "intcomma_many": "speakhuman.number",
+    "intword": "speakhuman.number",
+    "metric": "speakhuman.number",
+    "ordinal": "speakhuman.number",
+    "scientific": "speakhuman.number",
+    "naturaldate": "speakhuman.time",
+    "naturalday": "speakhuman.time",
+    "naturaldelta": "speakhuman.time",
+    "naturaltime": "speakhuman.time",
+    "precisedelta": "speakhuman.time",
+}
 
 __all__ = [
     "__version__",
@@ -36,6 +67,7 @@ __all__ = [
     "decimal_separator",
     "fractional",
     "intcomma",
+    "intcomma_many",
     "intword",
     "metric",
     "natural_list",
@@ -49,3 +81,29 @@ __all__ = [
     "scientific",
     "thousands_separator",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: object = version("speakhuman")
+    elif name in _SUBMODULES:
+        from importlib import import_module
+
+        value = import_module(f"{__name__}.{name}")
+    else:
+        module_name = _LAZY_SUBMODULE.get(name)
+        if module_name is None:
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        from importlib import import_module
+
+        value = getattr(import_module(module_name), name)
+    # Cache on the module so subsequent lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*__all__, *_SUBMODULES])
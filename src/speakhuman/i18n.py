@@ -160,6 +160,26 @@ def _gettext_noop(message: str) -> str:
     return message
 
 
+def _pgettext_noop(msgctxt: str, message: str) -> tuple[str, str]:
+    """Mark a contextualized string as a translation string without translating it.
+
+    Example usage:
+    ```python
+    CONSTANTS = [_pgettext_noop('ctx', 'first'), _pgettext_noop('ctx', 'second')]
+    def num_name(n):
+        return _pgettext(*CONSTANTS[n])
+    ```
+
+    Args:
+        msgctxt (str): Context of the translation.
+        message (str): Text to translate in the future.
+
+    Returns:
+        tuple: Original context and text, unchanged.
+    """
+    return msgctxt, message
+
+
 def _ngettext_noop(singular: str, plural: str) -> tuple[str, str]:
     """Mark two strings as pluralized translations without translating them.
 
@@ -5,12 +5,15 @@ from __future__ import annotations
 import bisect
 
 from .i18n import _gettext as _
+from .i18n import _gettext_noop as N_
 from .i18n import _ngettext, decimal_separator, thousands_separator
 from .i18n import _ngettext_noop as NS_
 from .i18n import _pgettext as P_
+from .i18n import _pgettext_noop as PN_
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import TypeAlias
 
     # This type can be better defined by typing.SupportsFloat
@@ -31,6 +34,36 @@ def _format_not_finite(value: float) -> str:
     return ""
 
 
+# The suffixes are stored as pgettext-noop pairs so xgettext still sees the
+# literal msgctxt/msgid while `_py_ordinal` translates only the one it needs.
+_ORDINAL_SUFFIXES = {
+    "male": (
+        PN_("0 (male)", "th"),
+        PN_("1 (male)", "st"),
+        PN_("2 (male)", "nd"),
+        PN_("3 (male)", "rd"),
+        PN_("4 (male)", "th"),
+        PN_("5 (male)", "th"),
+        PN_("6 (male)", "th"),
+        PN_("7 (male)", "th"),
+        PN_("8 (male)", "th"),
+        PN_("9 (male)", "th"),
+    ),
+    "female": (
+        PN_("0 (female)", "th"),
+        PN_("1 (female)", "st"),
+        PN_("2 (female)", "nd"),
+        PN_("3 (female)", "rd"),
+        PN_("4 (female)", "th"),
+        PN_("5 (female)", "th"),
+        PN_("6 (female)", "th"),
+        PN_("7 (female)", "th"),
+        PN_("8 (female)", "th"),
+        PN_("9 (female)", "th"),
+    ),
+}
+
+
 def _py_ordinal(value: NumberOrString, gender: str = "male") -> str:
     """Converts an integer to its ordinal as a string.
 
@@ -76,35 +109,14 @@ def _py_ordinal(value: NumberOrString, gender: str = "male") -> str:
         value = int(value)
     except (TypeError, ValueError):
         return str(value)
-    if gender == "male":
-        t = (
-            P_("0 (male)", "th"),
-            P_("1 (male)", "st"),
-            P_("2 (male)", "nd"),
-            P_("3 (male)", "rd"),
-            P_("4 (male)", "th"),
-            P_("5 (male)", "th"),
-            P_("6 (male)", "th"),
-            P_("7 (male)", "th"),
-            P_("8 (male)", "th"),
-            P_("9 (male)", "th"),
-        )
-    else:
-        t = (
-            P_("0 (female)", "th"),
-            P_("1 (female)", "st"),
-            P_("2 (female)", "nd"),
-            P_("3 (female)", "rd"),
-            P_("4 (female)", "th"),
-            P_("5 (female)", "th"),
-            P_("6 (female)", "th"),
-            P_("7 (female)", "th"),
-            P_("8 (female)", "th"),
-            P_("9 (female)", "th"),
-        )
+    gender = "male" if gender == "male" else "female"
     if value % 100 in (11, 12, 13):  # special case
-        return f"{value}{t[0]}"
-    return f"{value}{t[value % 10]}"
+        digit = 0
+    else:
+        digit = value % 10
+    # Translate only the suffix that is needed rather than all ten.
+    suffix = P_(*_ORDINAL_SUFFIXES[gender][digit])
+    return f"{value}{suffix}"
 
 
 def _py_intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
@@ -168,13 +180,48 @@ def _py_intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
     orig = orig.replace(".", decimal_sep)
     import re
 
+    # Compile once and build the replacement outside the loop; re's internal
+    # pattern cache still pays a lookup per re.sub call otherwise.
+    sub = re.compile(r"^(-?\d+)(\d{3})").sub
+    replacement = rf"\g<1>{thousands_sep}\g<2>"
     while True:
-        new = re.sub(r"^(-?\d+)(\d{3})", rf"\g<1>{thousands_sep}\g<2>", orig)
+        new = sub(replacement, orig)
         if orig == new:
             return new
         orig = new
 
 
+def _py_intcomma_many(
+    values: Iterable[NumberOrString], ndigits: int | None = None
+) -> list[str]:
+    """Converts every value in an iterable like `intcomma` does.
+
+    A batch counterpart to `intcomma` for formatting whole columns of numbers
+    at once. Accepts any iterable — a list, a generator or a NumPy array —
+    and returns a list of strings.
+
+    Examples:
+        ```pycon
+        >>> intcomma_many([100, 1000, 1_000_000])
+        ['100', '1,000', '1,000,000']
+        >>> intcomma_many([14308.40, 1234.5454545], 1)
+        ['14,308.4', '1,234.5']
+        >>> intcomma_many([])
+        []
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Values to convert.
+        ndigits (int, None): Digits of precision for rounding after the decimal
+            point, applied to every value.
+
+    Returns:
+        list of str: One converted string per input value.
+    """
+    return [_py_intcomma(value, ndigits) for value in values]
+
+
 powers = [10**x for x in (3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 100)]
 human_powers = (
     NS_("thousand", "thousand"),
@@ -266,6 +313,20 @@ def _py_intword(value: NumberOrString, format: str = "%.1f") -> str:
     return f"{negative_prefix}{number} {unit}"
 
 
+_AP_WORDS = (
+    N_("zero"),
+    N_("one"),
+    N_("two"),
+    N_("three"),
+    N_("four"),
+    N_("five"),
+    N_("six"),
+    N_("seven"),
+    N_("eight"),
+    N_("nine"),
+)
+
+
 def _py_apnumber(value: NumberOrString) -> str:
     """Converts an integer to Associated Press style.
 
@@ -304,18 +365,8 @@ def _py_apnumber(value: NumberOrString) -> str:
         return str(value)
     if not 0 <= value < 10:
         return str(value)
-    return (
-        _("zero"),
-        _("one"),
-        _("two"),
-        _("three"),
-        _("four"),
-        _("five"),
-        _("six"),
-        _("seven"),
-        _("eight"),
-        _("nine"),
-    )[value]
+    # Translate only the word that is needed rather than all ten.
+    return _(_AP_WORDS[value])
 
 
 def _py_fractional(value: NumberOrString) -> str:
@@ -602,12 +653,23 @@ def _is_english_locale() -> bool:
 try:
     from speakhuman._speakhuman_rs import (
         apnumber as _rs_apnumber,
+    )
+    from speakhuman._speakhuman_rs import (
         fractional,
+        metric,
+        scientific,
+    )
+    from speakhuman._speakhuman_rs import (
         intcomma as _rs_intcomma,
+    )
+    from speakhuman._speakhuman_rs import (
+        intcomma_many as _rs_intcomma_many,
+    )
+    from speakhuman._speakhuman_rs import (
         intword as _rs_intword,
-        metric,
+    )
+    from speakhuman._speakhuman_rs import (
         ordinal as _rs_ordinal,
-        scientific,
     )
 
     def ordinal(value: NumberOrString, gender: str = "male") -> str:  # noqa: D103
@@ -620,6 +682,15 @@ try:
             return _rs_intcomma(value, ndigits)
         return _py_intcomma(value, ndigits)
 
+    def intcomma_many(  # noqa: D103
+        values: Iterable[NumberOrString], ndigits: int | None = None
+    ) -> list[str]:
+        if _is_english_locale():
+            if not isinstance(values, list):
+                values = list(values)
+            return _rs_intcomma_many(values, ndigits)
+        return _py_intcomma_many(values, ndigits)
+
     def intword(value: NumberOrString, format: str = "%.1f") -> str:  # noqa: D103
         if _is_english_locale():
             return _rs_intword(value, format)
@@ -633,6 +704,7 @@ try:
 except ImportError:
     ordinal = _py_ordinal
     intcomma = _py_intcomma
+    intcomma_many = _py_intcomma_many
     intword = _py_intword
     apnumber = _py_apnumber
     fractional = _py_fractional
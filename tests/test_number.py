@@ -83,6 +83,27 @@ def test_intcomma(
     assert speakhuman.intcomma(*test_args) == expected
 
 
+@pytest.mark.parametrize(
+    "test_args, expected",
+    [
+        ([[100, 1000, 10311]], ["100", "1,000", "10,311"]),
+        ([[1_000_000, 1_234_567.25]], ["1,000,000", "1,234,567.25"]),
+        ([["1000", "1234567.1234567"]], ["1,000", "1,234,567.1234567"]),
+        ([[14308.40, 1234.5454545], 1], ["14,308.4", "1,234.5"]),
+        ([[]], []),
+    ],
+)
+def test_intcomma_many(test_args: list[typing.Any], expected: list[str]) -> None:
+    assert speakhuman.intcomma_many(*test_args) == expected
+
+
+def test_intcomma_many_accepts_any_iterable() -> None:
+    assert speakhuman.intcomma_many(iter([1000, 1_000_000])) == [
+        "1,000",
+        "1,000,000",
+    ]
+
+
 def test_intword_powers() -> None:
     # make sure that powers & human_powers have the same number of items
     assert len(number.powers) == len(number.human_powers)